@@ -1,11 +1,13 @@
-from .converter import (
-    midi_to_csv,
-    csv_to_midi,
-    combine_midis,
-)
-
 __all__ = [
     "midi_to_csv",
     "csv_to_midi",
     "combine_midis"
 ]
+
+
+def __getattr__(name):
+    # The converter pulls in pandas and music21, so it is only imported on first use
+    if name in __all__:
+        from . import converter
+        return getattr(converter, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,15 @@
+import copy
+import csv
 import os
-import pandas as pd
-import music21
+import shutil
+import numpy as np
 import logging
 
-from music21.note import Unpitched
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from fractions import Fraction
+from functools import lru_cache
+from itertools import islice, repeat
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -13,100 +19,398 @@ DATA_INPUT_MIDI = "data/input-midi"
 DATA_OUTPUT_CSV = "data/output-csv"
 DATA_OUTPUT_MIDI = "data/output-midi"
 
-# Ensure output directories exist
-os.makedirs(DATA_OUTPUT_CSV, exist_ok=True)
-os.makedirs(DATA_OUTPUT_MIDI, exist_ok=True)
+# CSV layout
+CSV_COLUMNS = ["note_name", "start_time", "duration", "velocity", "tempo"]
+
+# Number of elements serialized and rounded together when streaming rows to a CSV
+_ROW_CHUNK_SIZE = 4096
+
+# MIDI note number -> note name, spelled the way music21 spells pitches read from MIDI
+_PITCH_CLASS_NAMES = ("C", "C#", "D", "E-", "E", "F", "F#", "G", "G#", "A", "B-", "B")
+_MIDI_NOTE_NAMES = np.array([f"{name}{octave}" for octave in range(-1, 10) for name in _PITCH_CLASS_NAMES][:128],
+                            dtype=object)
 
 
 # Private functions
 
-def _serialize_element_to_dict(element, additional_fields):
+def _list_files(directory, extension):
     """
-    Serialize a music21 element to a dictionary.
+    List the files in a directory that have the given extension.
+
+    os.scandir reports the entry type along with the name, so no extra stat call is made per file.
 
     Args:
-        element (music21.note.Note): The music21 element to serialize.
-        additional_fields (dict): Additional fields to include in the serialized output.
+        directory (str): Path to the directory to list.
+        extension (str): File extension to keep, e.g. ".mid".
 
     Returns:
-        dict: Serialized representation of the element.
-    """
-    if element.isRest:
-        note_name = "Rest"
-    elif element.isNote:
-        note_name = element.nameWithOctave
-    elif element.isChord:
-        note_name = ",".join(p.nameWithOctave for p in element.pitches)
-    elif isinstance(element, Unpitched):
-        note_name = element.displayName
-    else:
-        note_name = ",".join(p.displayName for p in element.notes)
+        list of str: Paths of the matching files.
+    """
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.is_file() and entry.name.endswith(extension)]
+
+
+def _ensure_parent_directory(output_path):
+    """
+    Create the directory an output file will be written to, if it does not exist yet.
+
+    Args:
+        output_path (str): Path of the file about to be written.
+    """
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+@contextmanager
+def _open_for_replace(output_path):
+    """
+    Open a temporary file next to an output file, and move it into place once the block completes.
+
+    If the block fails, the temporary file is removed and any existing output file is left untouched,
+    so a failed write never leaves a truncated file behind.
+
+    Args:
+        output_path (str): Path of the file about to be written.
+
+    Yields:
+        file: The temporary file, opened for writing text.
+    """
+    _ensure_parent_directory(output_path)
+    temp_path = f"{output_path}.tmp"
+    try:
+        with open(temp_path, "w", newline="") as temp_file:
+            yield temp_file
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _rest_name(element):
+    """Return the CSV note name of a rest."""
+    return "Rest"
+
+
+def _note_name(element):
+    """Return the CSV note name of a pitched note."""
+    # Reading the pitch directly skips Note's forwarding property
+    return element.pitch.nameWithOctave
+
+
+def _chord_name(element):
+    """Return the CSV note name of a chord, its pitches joined by commas."""
+    return ",".join(p.nameWithOctave for p in element.pitches)
+
+
+def _unpitched_name(element):
+    """Return the CSV note name of an unpitched (percussion) note."""
+    return element.displayName
+
+
+def _percussion_chord_name(element):
+    """Return the CSV note name of a percussion chord, its notes joined by commas."""
+    return ",".join(p.displayName for p in element.notes)
+
+
+# Element type -> note name serializer, looked up by exact type on the hot path.
+# Filled in on first use so that importing notapy does not import music21.
+_NOTE_NAME_SERIALIZERS = {}
+
+
+def _note_name_serializer(element_type):
+    """
+    Find the note name serializer for an element type.
+
+    The type is resolved through its MRO once and then remembered in
+    _NOTE_NAME_SERIALIZERS, so later lookups are a single dict access.
+
+    Args:
+        element_type (type): The music21 class of the element.
 
-    base_fields = {
-        "note_name": note_name,
-        "start_time": round(float(element.offset), 3),
-        "duration": round(element.duration.quarterLength, 3),
-        "velocity": element.volume.velocity if hasattr(element, 'volume') else None,
+    Returns:
+        callable: Function returning the CSV note name of an element.
+    """
+    import music21
+
+    known_serializers = {
+        music21.note.Rest: _rest_name,
+        music21.note.Note: _note_name,
+        music21.chord.Chord: _chord_name,
+        music21.note.Unpitched: _unpitched_name,
+        music21.percussion.PercussionChord: _percussion_chord_name,
     }
-    return {**base_fields, **additional_fields}
+    for cls in element_type.__mro__:
+        serializer = known_serializers.get(cls)
+        if serializer is not None:
+            break
+    else:
+        serializer = _percussion_chord_name
+    _NOTE_NAME_SERIALIZERS[element_type] = serializer
+    return serializer
+
+
+def _serialize_element(element):
+    """
+    Serialize a music21 element to the raw fields of a CSV row.
+
+    Offsets and durations are returned unrounded so that a whole column can be rounded at once.
+
+    Args:
+        element (music21.note.Note): The music21 element to serialize.
 
+    Returns:
+        tuple: The note name, offset, quarter length, and velocity of the element.
+    """
+    element_type = type(element)
+    serializer = _NOTE_NAME_SERIALIZERS.get(element_type) or _note_name_serializer(element_type)
+    volume = getattr(element, 'volume', None)
+
+    return (
+        serializer(element),
+        element.offset,
+        element.duration.quarterLength,
+        volume.velocity if volume is not None else None,
+    )
 
-def _deserialize_row_to_element(row):
+
+def _round_times(values):
     """
-    Deserialize a row from a DataFrame to a music21 note, chord, or rest element.
+    Round a column of offsets or durations to 3 decimals in a single vectorized pass.
 
     Args:
-        row (pd.Series): The row containing note information.
+        values (sequence): Quarter-length values as floats, Fractions, or a numpy array.
 
     Returns:
-        tuple: A tuple containing the deserialized music21 note/chord/rest and any additional fields.
+        list of float: The rounded values as plain Python floats.
+    """
+    return np.round(np.asarray(values, dtype=np.float64), 3).tolist()
+
+
+@lru_cache(maxsize=None)
+def _quarter_length(value):
     """
-    if row['note_name'] == 'Rest':
-        element = music21.note.Rest(quarterLength=row['duration'])
-    elif "," in row['note_name']:
-        pitches = [music21.pitch.Pitch(p) for p in row['note_name'].split(",")]
-        element = music21.chord.Chord(pitches, duration=music21.duration.Duration(row['duration']))
+    Normalize a CSV duration value to a music21 quarter length.
+
+    Music repeats the same handful of durations, so the parsed value is memoized.
+    The music21 objects themselves are not cached because each one is linked to
+    the note that owns it.
+
+    Args:
+        value (float or str): Duration as read from the CSV, e.g. 0.5 or "667/1000".
+
+    Returns:
+        float or Fraction: The quarter length as music21 represents it.
+    """
+    import music21
+
+    if isinstance(value, str):
+        value = Fraction(value)
+    return music21.common.opFrac(value)
+
+
+def _deserialize_row_to_element(note_name, start_time, duration, velocity):
+    """
+    Deserialize the fields of a CSV row to a music21 note, chord, or rest element.
+
+    Args:
+        note_name (str): Note name, comma-separated pitch names for a chord, or "Rest".
+        start_time (float): Offset of the element in quarter lengths.
+        duration (float or str): Duration of the element in quarter lengths.
+        velocity (int): MIDI velocity of the note.
+
+    Returns:
+        music21.note.GeneralNote: The deserialized music21 note/chord/rest.
+    """
+    import music21
+
+    quarter_length = _quarter_length(duration)
+    if note_name == 'Rest':
+        element = music21.note.Rest(quarterLength=quarter_length)
+    elif "," in note_name:
+        element = music21.chord.Chord(note_name.split(","), quarterLength=quarter_length)
     else:
-        element = music21.note.Note(row['note_name'], duration=music21.duration.Duration(row['duration']))
-        element.volume.velocity = row['velocity']
-    element.offset = row['start_time']
-    additional_fields = row.to_dict()
-    return element, additional_fields
+        element = music21.note.Note(note_name, quarterLength=quarter_length)
+        element.volume.velocity = velocity
+    element.offset = start_time
+    return element
 
 
-def _midi_to_csv(midi_file_path, output_csv_path):
+def _load_stream(midi_source):
     """
-    Convert a MIDI file to a CSV file containing note information.
+    Load a MIDI file as a flat music21 stream.
+
+    An already-parsed stream is passed through, so callers that hold one do not parse the file again.
 
     Args:
-        midi_file_path (str): Path to the input MIDI file.
-        output_csv_path (str): Path to save the output CSV file.
+        midi_source (str or music21.stream.Stream): Path to the input MIDI file, or a parsed stream.
+
+    Returns:
+        music21.stream.Stream: The flattened stream of the MIDI file.
+    """
+    import music21
+
+    if isinstance(midi_source, music21.stream.Stream):
+        return midi_source if midi_source.isFlat else midi_source.flat
+
+    midi_file = music21.midi.MidiFile()
+    midi_file.open(midi_source)
+    midi_file.read()
+    midi_file.close()
+
+    return music21.midi.translate.midiFileToStream(midi_file, quantizePost=False).flat
+
+
+def _iter_rows(stream, tempo):
+    """
+    Yield the CSV rows of a flat music21 stream.
+
+    Elements are serialized in chunks of _ROW_CHUNK_SIZE so that each chunk's offsets and
+    durations are still rounded in one vectorized pass, while only one chunk of rows is
+    held in memory before it is written.
+
+    Args:
+        stream (music21.stream.Stream): The flattened stream to serialize.
+        tempo (float): Tempo written on every row.
+
+    Yields:
+        tuple: One row per note, chord, or rest in CSV_COLUMNS order.
+    """
+    # The stream is already flat, so its notes and rests can be iterated without recursing.
+    # A generator is used because music21's iterator resets itself whenever iter() is called on it.
+    elements = (element for element in stream.notesAndRests)
+    while True:
+        fields = [_serialize_element(element) for element in islice(elements, _ROW_CHUNK_SIZE)]
+        if not fields:
+            return
+        note_names, offsets, durations, velocities = zip(*fields)
+        yield from zip(note_names, _round_times(offsets), _round_times(durations), velocities, repeat(tempo))
+
+
+def _music21_rows(midi_source):
+    """
+    Read the note rows of a MIDI file using music21.
+
+    Args:
+        midi_source (str or music21.stream.Stream): Path to the input MIDI file, or a parsed stream.
+
+    Returns:
+        iterator of tuple: One row per note, chord, or rest in CSV_COLUMNS order.
+    """
+    stream = _load_stream(midi_source)
+
+    note_tempo = stream.metronomeMarkBoundaries()[0][2].number if stream.metronomeMarkBoundaries() else 120
+
+    return _iter_rows(stream, note_tempo)
+
+
+@lru_cache(maxsize=None)
+def _symusic_installed():
+    """
+    Check whether the optional symusic backend can be imported.
+
+    The probe runs on first use, so processes that never convert with symusic do not import it.
+
+    Returns:
+        bool: True if symusic is installed.
     """
     try:
-        midi_file = music21.midi.MidiFile()
-        midi_file.open(midi_file_path)
-        midi_file.read()
-        midi_file.close()
+        import symusic  # noqa: F401
+    except ImportError:
+        return False
+    return True
 
-        stream = music21.midi.translate.midiFileToStream(midi_file, quantizePost=False).flat
 
-        df = pd.DataFrame(columns=["note_name", "start_time", "duration", "velocity", "tempo"])
+def _symusic_rows(midi_source):
+    """
+    Read the note rows of a MIDI file using symusic.
+
+    symusic exposes each track's notes as numpy arrays, so the columns are built with
+    vectorized operations instead of per-note Python code. symusic does not group notes
+    into chords or infer rests, so every note gets its own row.
 
-        note_tempo = stream.metronomeMarkBoundaries()[0][2].number if stream.metronomeMarkBoundaries() else 120
+    Args:
+        midi_source (str or symusic.Score): Path to the input MIDI file, or a parsed score.
 
-        for element in stream.recurse().notesAndRests:
-            # Handle notes, chords, and rests
-            if not element.isStream and not element.lyric:
-                additional_fields = {
-                    "tempo": note_tempo,
-                }
-                new_row = _serialize_element_to_dict(element, additional_fields)
-                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+    Returns:
+        iterable of tuple: One row per note in CSV_COLUMNS order, ordered by start time.
+    """
+    import symusic
+
+    if isinstance(midi_source, (str, os.PathLike)):
+        score = symusic.Score(midi_source, ttype="quarter")
+    else:
+        score = midi_source.to("quarter")
+    # Rounded from the microseconds per quarter note the same way music21 reads the tempo
+    note_tempo = round(60_000_000 / score.tempos[0].mspq, 2) if len(score.tempos) else 120
+
+    tracks = [track.notes.numpy() for track in score.tracks]
+    columns = {
+        field: np.concatenate([notes[field] for notes in tracks]) if tracks else np.empty(0)
+        for field in ("time", "duration", "pitch", "velocity")
+    }
+    order = np.argsort(columns["time"], kind="stable")
+
+    # tolist() hands the csv writer plain Python values instead of numpy scalars
+    return zip(
+        _MIDI_NOTE_NAMES[columns["pitch"][order].astype(np.intp)].tolist(),
+        _round_times(columns["time"][order]),
+        _round_times(columns["duration"][order]),
+        columns["velocity"][order].tolist(),
+        repeat(note_tempo),
+    )
+
+
+def _midi_to_csv(midi_source, output_csv_path, backend="music21"):
+    """
+    Convert a MIDI file to a CSV file containing note information.
+
+    Args:
+        midi_source (str, music21.stream.Stream or symusic.Score): Path to the input MIDI file,
+            or a file already parsed by the chosen backend.
+        output_csv_path (str): Path to save the output CSV file.
+        backend (str): MIDI parser to use, "music21" or "symusic" (default: "music21").
+
+    Returns:
+        str: The output CSV path, or None if the conversion failed.
+    """
+    try:
+        if backend == "symusic" and not _symusic_installed():
+            logging.warning("symusic is not installed, falling back to the music21 backend")
+            backend = "music21"
+        if backend not in ("music21", "symusic"):
+            raise ValueError(f"Unknown MIDI backend: {backend}")
+
+        # Rows are streamed straight to the file as they are produced; no DataFrame or row list is built
+        rows = _symusic_rows(midi_source) if backend == "symusic" else _music21_rows(midi_source)
+        with _open_for_replace(output_csv_path) as csv_file:
+            writer = csv.writer(csv_file, lineterminator="\n")
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(rows)
 
-        df.to_csv(output_csv_path, index=False)
         logging.info(f"MIDI to CSV conversion complete: {output_csv_path}")
+        return output_csv_path
     except Exception as e:
         logging.error(f"Failed to convert MIDI to CSV: {e}")
+        return None
+
+
+@lru_cache(maxsize=None)
+def _csv_engine():
+    """
+    Pick the pandas CSV parser to read note CSVs with.
+
+    The multithreaded pyarrow engine is used when pyarrow is installed, otherwise pandas' default C engine.
+
+    Returns:
+        str: The engine name to pass to pd.read_csv.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "c"
+    return "pyarrow"
 
 
 def _csv_to_midi(csv_file_path, output_midi_path):
@@ -116,9 +420,15 @@ def _csv_to_midi(csv_file_path, output_midi_path):
     Args:
         csv_file_path (str): Path to the input CSV file.
         output_midi_path (str): Path to save the output MIDI file.
+
+    Returns:
+        str: The output MIDI path, or None if the conversion failed.
     """
+    import music21
+    import pandas as pd
+
     try:
-        df = pd.read_csv(csv_file_path)
+        df = pd.read_csv(csv_file_path, engine=_csv_engine())
         stream = music21.stream.Stream()
 
         if not df.empty:
@@ -126,48 +436,113 @@ def _csv_to_midi(csv_file_path, output_midi_path):
             mm = music21.tempo.MetronomeMark(number=desired_tempo)
             stream.append(mm)
 
-        for _, row in df.iterrows():
-            element, _ = _deserialize_row_to_element(row)
-            stream.insert(element)
-
+        # Pull each column out once as plain Python scalars instead of building a Series per row
+        rows = zip(
+            df['note_name'].tolist(),
+            df['start_time'].tolist(),
+            df['duration'].tolist(),
+            df['velocity'].tolist(),
+        )
+        # coreInsert skips the per-insert sort bookkeeping; the stream is marked
+        # as changed once at the end and sorted lazily when it is written
+        for note_name, start_time, duration, velocity in rows:
+            element = _deserialize_row_to_element(note_name, start_time, duration, velocity)
+            stream.coreInsert(element.offset, element)
+        stream.coreElementsChanged()
+
+        _ensure_parent_directory(output_midi_path)
         stream.write('midi', output_midi_path)
         logging.info(f"CSV to MIDI conversion complete: {output_midi_path}")
+        return output_midi_path
     except Exception as e:
         logging.error(f"Failed to convert CSV to MIDI: {e}")
+        return None
 
 
-def _combine_midis(midi_file_paths, output_midi_path):
+def _combine_midis(midi_sources, output_midi_path):
     """
     Combine multiple MIDI files into a single MIDI file.
 
     Args:
-        midi_file_paths (list of str): List of paths to the input MIDI files.
+        midi_sources (list of str or music21.stream.Stream): Paths to the input MIDI files, or parsed streams.
         output_midi_path (str): Path to save the combined MIDI file.
     """
+    import music21
+
     try:
         combined_stream = music21.stream.Stream()
 
-        for midi_file_path in midi_file_paths:
+        for midi_source in midi_sources:
             try:
-                midi_file = music21.midi.MidiFile()
-                midi_file.open(midi_file_path)
-                midi_file.read()
-                midi_file.close()
-
-                stream = music21.midi.translate.midiFileToStream(midi_file, quantizePost=False).flat
+                stream = _load_stream(midi_source)
+                # A stream can only be placed in the combined stream once, so repeated sources are copied
+                if combined_stream.hasElement(stream):
+                    stream = copy.deepcopy(stream)
                 combined_stream.append(stream)
             except Exception as e:
-                logging.error(f"Failed to process MIDI file {midi_file_path}: {e}")
+                logging.error(f"Failed to process MIDI file {midi_source}: {e}")
 
+        _ensure_parent_directory(output_midi_path)
         combined_stream.write('midi', output_midi_path)
         logging.info(f"Combined MIDI file created: {output_midi_path}")
     except Exception as e:
         logging.error(f"Failed to combine MIDI files: {e}")
 
 
+def _combine_csvs(csv_file_paths, output_csv_path):
+    """
+    Combine multiple CSV files with the same columns into a single CSV file.
+
+    The files are copied through one at a time, keeping only the first header,
+    so no file needs to be loaded into a DataFrame.
+
+    Args:
+        csv_file_paths (list of str): List of paths to the input CSV files.
+        output_csv_path (str): Path to save the combined CSV file.
+    """
+    try:
+        header_written = False
+        with _open_for_replace(output_csv_path) as combined_file:
+            for csv_file_path in csv_file_paths:
+                if os.path.abspath(csv_file_path) == os.path.abspath(output_csv_path):
+                    continue
+                with open(csv_file_path, newline="") as csv_file:
+                    header = csv_file.readline()
+                    if not header_written:
+                        combined_file.write(header)
+                        header_written = True
+                    shutil.copyfileobj(csv_file, combined_file)
+
+        logging.info(f"Combined CSV file created: {output_csv_path}")
+    except Exception as e:
+        logging.error(f"Failed to combine CSV files: {e}")
+
+
+def _map_files(function, files, *arguments, max_workers=None):
+    """
+    Apply a conversion function to each file, in parallel worker processes when there is more than one file.
+
+    Files are converted in this process when max_workers is 1 or there is at most one file, so callers
+    that cannot start child processes (such as daemonic pool workers) can still convert a directory.
+
+    Args:
+        function (callable): Conversion function, called with each file and its matching arguments.
+        files (list of str): Paths to the input files.
+        *arguments (iterable): Further per-file arguments, one iterable per parameter.
+        max_workers (int): Number of worker processes (default: None, one per CPU).
+
+    Returns:
+        list: The result of each call, in the order of the files.
+    """
+    if max_workers == 1 or len(files) <= 1:
+        return list(map(function, files, *arguments))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(function, files, *arguments))
+
+
 # Public functions
 
-def midi_to_csv(input_path, output_path, combine_output=False):
+def midi_to_csv(input_path, output_path, combine_output=False, max_workers=None, backend="music21"):
     """
     Convert MIDI files to CSV files.
     This function can handle both single file and directory input modes.
@@ -176,27 +551,29 @@ def midi_to_csv(input_path, output_path, combine_output=False):
         input_path (str): Path to the input MIDI file or directory.
         output_path (str): Path to save the output CSV file or directory.
         combine_output (bool): Whether to combine all MIDI files in the input directory into one CSV (default: False).
+        max_workers (int): Number of worker processes used in directory mode (default: None, one per CPU;
+            1 converts the files in this process without starting workers).
+        backend (str): MIDI parser to use, "music21" or "symusic" (default: "music21").
     """
     try:
         if os.path.isdir(input_path):
-            midi_files = [os.path.join(input_path, f) for f in os.listdir(input_path) if f.endswith('.mid')]
-            for midi_file in midi_files:
-                csv_output_path = os.path.join(output_path, os.path.basename(midi_file).replace('.mid', '.csv'))
-                _midi_to_csv(midi_file, csv_output_path)
+            midi_files = _list_files(input_path, '.mid')
+            csv_output_paths = [os.path.join(output_path, os.path.basename(midi_file).replace('.mid', '.csv'))
+                                for midi_file in midi_files]
+            # Files are independent and parsing is CPU-bound, so convert them in parallel processes
+            results = _map_files(_midi_to_csv, midi_files, csv_output_paths, repeat(backend), max_workers=max_workers)
             if combine_output and len(midi_files) > 1:
                 combined_csv_path = os.path.join(output_path, 'combined.csv')
-                combined_dfs = [pd.read_csv(os.path.join(output_path, f)) for f in os.listdir(output_path) if
-                                f.endswith('.csv')]
-                combined_df = pd.concat(combined_dfs, ignore_index=True)
-                combined_df.to_csv(combined_csv_path, index=False)
-                logging.info(f"Combined CSV file created: {combined_csv_path}")
+                # Combine only the CSVs written by this run, not whatever else is in the output directory
+                written_csv_paths = [path for path in results if path is not None and path != combined_csv_path]
+                _combine_csvs(written_csv_paths, combined_csv_path)
         else:
-            _midi_to_csv(input_path, output_path)
+            _midi_to_csv(input_path, output_path, backend)
     except Exception as e:
         logging.error(f"Error in midi_to_csv: {e}")
 
 
-def csv_to_midi(input_path, output_path, combine_output=False):
+def csv_to_midi(input_path, output_path, combine_output=False, max_workers=None):
     """
     Convert CSV files to MIDI files.
     This function can handle both single file and directory input modes.
@@ -205,17 +582,19 @@ def csv_to_midi(input_path, output_path, combine_output=False):
         input_path (str): Path to the input CSV file or directory.
         output_path (str): Path to save the output MIDI file or directory.
         combine_output (bool): Whether to combine all CSV files in the input directory into one MIDI (default: False).
+        max_workers (int): Number of worker processes used in directory mode (default: None, one per CPU;
+            1 converts the files in this process without starting workers).
     """
     try:
         if os.path.isdir(input_path):
-            csv_files = [os.path.join(input_path, f) for f in os.listdir(input_path) if f.endswith('.csv')]
-            for csv_file in csv_files:
-                midi_output_path = os.path.join(output_path, os.path.basename(csv_file).replace('.csv', '.mid'))
-                _csv_to_midi(csv_file, midi_output_path)
+            csv_files = _list_files(input_path, '.csv')
+            midi_output_paths = [os.path.join(output_path, os.path.basename(csv_file).replace('.csv', '.mid'))
+                                 for csv_file in csv_files]
+            results = _map_files(_csv_to_midi, csv_files, midi_output_paths, max_workers=max_workers)
             if combine_output and len(csv_files) > 1:
                 combined_midi_path = os.path.join(output_path, 'combined.mid')
-                _combine_midis([os.path.join(output_path, f) for f in os.listdir(output_path) if f.endswith('.mid')],
-                               combined_midi_path)
+                written_midi_paths = [path for path in results if path is not None and path != combined_midi_path]
+                _combine_midis(written_midi_paths, combined_midi_path)
         else:
             _csv_to_midi(input_path, output_path)
     except Exception as e:
@@ -231,7 +610,7 @@ def combine_midis(input_directory, output_midi_path):
         output_midi_path (str): Path to save the combined MIDI file.
     """
     try:
-        midi_files = [os.path.join(input_directory, f) for f in os.listdir(input_directory) if f.endswith('.mid')]
+        midi_files = _list_files(input_directory, '.mid')
         _combine_midis(midi_files, output_midi_path)
     except Exception as e:
         logging.error(f"Error in combine_midis: {e}")
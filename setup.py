@@ -9,9 +9,14 @@ setup(
     url='https://github.com/altaiiiir/notapy',
     packages=find_packages(),
     install_requires=[
+        'numpy',
         'pandas',
         'music21',
     ],
+    extras_require={
+        'symusic': ['symusic'],
+        'pyarrow': ['pyarrow'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
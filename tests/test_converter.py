@@ -0,0 +1,113 @@
+import csv
+import os
+
+import music21
+import pytest
+
+from notapy import converter
+from notapy.converter import _combine_csvs, _combine_midis, _midi_to_csv
+
+
+def _write_midi(path, note_count, bpm=None):
+    stream = music21.stream.Stream()
+    if bpm is not None:
+        stream.append(music21.tempo.MetronomeMark(number=bpm))
+    for i in range(note_count):
+        stream.append(music21.note.Note(60 + i % 12, quarterLength=1))
+    stream.write('midi', str(path))
+    return str(path)
+
+
+def _read_rows(csv_path):
+    with open(csv_path, newline="") as csv_file:
+        return list(csv.DictReader(csv_file))
+
+
+def _note_count(midi_path):
+    return len(music21.converter.parse(midi_path).flat.notes)
+
+
+def test_combine_midis_repeated_path(tmp_path):
+    midi_path = _write_midi(tmp_path / "song.mid", 10)
+    output_path = str(tmp_path / "combined.mid")
+
+    _combine_midis([midi_path, midi_path], output_path)
+
+    assert _note_count(output_path) == 20
+
+
+def test_midi_to_csv_failure_leaves_no_file(tmp_path, monkeypatch):
+    midi_path = _write_midi(tmp_path / "song.mid", 10)
+    output_path = str(tmp_path / "song.csv")
+    serialize_element = converter._serialize_element
+    serialized = []
+
+    def failing_serialize_element(element):
+        serialized.append(element)
+        if len(serialized) > 5:
+            raise ValueError("unsupported element")
+        return serialize_element(element)
+
+    # Small chunks so that rows are written to the file before the failure
+    monkeypatch.setattr(converter, "_ROW_CHUNK_SIZE", 2)
+    monkeypatch.setattr(converter, "_serialize_element", failing_serialize_element)
+
+    assert _midi_to_csv(midi_path, output_path) is None
+    assert os.listdir(tmp_path) == ["song.mid"]
+
+
+def test_midi_to_csv_directory_in_process(tmp_path, monkeypatch):
+    input_directory = tmp_path / "midi"
+    input_directory.mkdir()
+    _write_midi(input_directory / "a.mid", 3)
+    _write_midi(input_directory / "b.mid", 4)
+    output_directory = tmp_path / "csv"
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("max_workers=1 should not start worker processes")
+
+    monkeypatch.setattr(converter, "ProcessPoolExecutor", no_pool)
+    converter.midi_to_csv(str(input_directory), str(output_directory), combine_output=True, max_workers=1)
+
+    assert sorted(os.listdir(output_directory)) == ["a.csv", "b.csv", "combined.csv"]
+
+
+def test_symusic_backend_matches_music21(tmp_path):
+    pytest.importorskip("symusic")
+    midi_path = _write_midi(tmp_path / "song.mid", 10, bpm=90)
+    music21_csv_path = _midi_to_csv(midi_path, str(tmp_path / "music21.csv"))
+    symusic_csv_path = _midi_to_csv(midi_path, str(tmp_path / "symusic.csv"), backend="symusic")
+
+    # symusic does not infer rests, so only the note rows are compared
+    music21_rows = [row for row in _read_rows(music21_csv_path) if row["note_name"] != "Rest"]
+    symusic_rows = _read_rows(symusic_csv_path)
+
+    columns = ["note_name", "start_time", "duration", "tempo"]
+    assert [[row[column] for column in columns] for row in symusic_rows] == \
+        [[row[column] for column in columns] for row in music21_rows]
+    assert symusic_rows[0]["tempo"] == "90.0"
+
+
+def test_combine_csvs(tmp_path):
+    header = "note_name,start_time,duration,velocity,tempo\n"
+    first_path = tmp_path / "a.csv"
+    second_path = tmp_path / "b.csv"
+    output_path = tmp_path / "combined.csv"
+    first_path.write_text(header + "C4,0.0,1.0,90,120.0\n")
+    second_path.write_text(header + "D4,0.0,0.5,80,120.0\nRest,0.5,0.5,,120.0\n")
+    output_path.write_text(header + "E4,0.0,1.0,70,120.0\n")
+
+    # The previous combined file is one of the inputs, and must not be copied into itself
+    _combine_csvs([str(first_path), str(output_path), str(second_path)], str(output_path))
+
+    assert output_path.read_text() == (header + "C4,0.0,1.0,90,120.0\n"
+                                       + "D4,0.0,0.5,80,120.0\nRest,0.5,0.5,,120.0\n")
+
+
+def test_combine_csvs_failure_leaves_no_file(tmp_path):
+    first_path = tmp_path / "a.csv"
+    first_path.write_text("note_name,start_time,duration,velocity,tempo\nC4,0.0,1.0,90,120.0\n")
+
+    _combine_csvs([str(first_path), str(tmp_path / "missing.csv")], str(tmp_path / "combined.csv"))
+
+    assert os.listdir(tmp_path) == ["a.csv"]